@@ -3,7 +3,10 @@ from __future__ import annotations
 
 from pathlib import Path
 import os
+import mmap
+import stat
 import codecs
+import tempfile
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 
@@ -11,10 +14,26 @@ from tkinter import ttk, filedialog, messagebox, simpledialog
 # Raw file I/O
 # =============================================================================
 
+# Files at least this big are decoded straight from a read-only mapping
+MMAP_READ_THRESHOLD = 8 << 20
+
 def read_text_bytes(path: Path | str) -> bytes:
     """Read raw bytes from disk."""
     return Path(path).read_bytes()
 
+def map_text_file(path: Path | str) -> mmap.mmap | None:
+    """
+    Read-only mmap of a large file (>= MMAP_READ_THRESHOLD bytes), else None.
+    The mapping is a bytes-like view of the page cache, so decoding it skips
+    the heap copy read_text_bytes() would make. Close it (or use `with`) as
+    soon as the decode is done; never keep it around, since later writes to
+    the file show through it.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_READ_THRESHOLD:
+            return None
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
 def save_to_path(path: Path | str, data: bytes) -> None:
     """
     Save bytes (create or truncate). This may create the file if missing
@@ -22,18 +41,109 @@ def save_to_path(path: Path | str, data: bytes) -> None:
     """
     Path(path).write_bytes(data)
 
+def save_chunks_to_path(path: Path | str, chunks) -> None:
+    """
+    Streaming save_to_path(): write an iterable of bytes chunks, so the whole
+    encoded file never has to exist in memory. Chunks may raise (encode errors)
+    partway, so an existing file is never truncated up front: it goes through
+    save_over_file(). A new file is removed again if the stream fails.
+    """
+    target = Path(path)
+    if target.exists():
+        save_over_file(target, chunks)
+        return
+    try:
+        with open(target, "wb") as f:
+            for data in chunks:
+                f.write(data)
+    except BaseException:
+        try:
+            os.unlink(target)
+        except OSError:
+            pass
+        raise
+
 def overwrite_file_inplace(path: Path | str, data: bytes) -> None:
     """
     Overwrite an existing file's contents without recreating it.
     Keeps inode, mode bits, ownership, and xattrs (mtime updates).
     Raises FileNotFoundError if the target does not exist.
     """
-    with open(path, "r+b") as f:
-        f.seek(0)
-        f.truncate(0)
-        f.write(data)
-        f.flush()
-        os.fsync(f.fileno())
+    # Raw fd: O_TRUNC replaces the seek+truncate, no BufferedRandom in between
+    fd = os.open(path, os.O_WRONLY | os.O_TRUNC)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fdatasync(fd)
+    finally:
+        os.close(fd)
+
+def replace_file_atomic(path: Path | str, chunks) -> None:
+    """
+    Write an iterable of bytes chunks to a private temp file next to `path`,
+    fsync it, then os.replace() it over `path`. A crash or encode error
+    mid-write leaves the original untouched. The original's permission bits
+    and owner/group are carried over (the inode itself is new, so hardlinks,
+    xattrs and ACLs are not; see save_over_file()).
+    """
+    target = Path(path)
+    try:
+        st = target.stat()
+    except FileNotFoundError:
+        st = None
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for data in chunks:
+                f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if st is not None:
+            os.chmod(tmp, stat.S_IMODE(st.st_mode))
+            tst = os.stat(tmp)
+            if (tst.st_uid, tst.st_gid) != (st.st_uid, st.st_gid):
+                os.chown(tmp, st.st_uid, st.st_gid)
+        os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+def _replace_is_invisible(path: Path, st: os.stat_result) -> bool:
+    """
+    Would swapping a new inode in for `path` (stat `st`) go unnoticed? Only for
+    a regular file with no other hardlinks, whose owner/group we can copy, and
+    that carries no xattrs (ACLs and security labels live there too).
+    """
+    if not stat.S_ISREG(st.st_mode) or st.st_nlink != 1:
+        return False
+    euid = os.geteuid()
+    if euid != 0:
+        if st.st_uid != euid:
+            return False
+        if st.st_gid != os.getegid() and st.st_gid not in os.getgroups():
+            return False
+    try:
+        return not os.listxattr(path)
+    except (AttributeError, OSError):
+        return False  # can't tell: stay on the safe side
+
+def save_over_file(path: Path | str, chunks) -> None:
+    """
+    Save an iterable of bytes chunks over an existing file. A symlink is
+    followed (its target is written, the link stays). When the swap would be
+    invisible this is replace_file_atomic(); otherwise the content is fully
+    encoded first (so an encode error leaves the file untouched) and then
+    written in place, keeping inode, hardlinks, owner, ACLs and xattrs.
+    """
+    target = Path(path).resolve()
+    if _replace_is_invisible(target, target.stat()):
+        replace_file_atomic(target, chunks)
+    else:
+        overwrite_file_inplace(target, b"".join(chunks))
 
 # =============================================================================
 # Encoding helpers
@@ -61,20 +171,24 @@ def suggest_open_encoding(path: Path | str) -> str:
     Trivial detector: if the file starts with UTF-8 BOM → 'utf-8-with-bom', else 'utf-8'.
     Extend here if you add chardet/uchardet later.
     """
-    b = read_text_bytes(path)[:4]
+    with open(path, "rb") as f:
+        b = f.read(4)
     if b.startswith(b"\xef\xbb\xbf"):
         return "utf-8-with-bom"
     return "utf-8"
 
-def decode_bytes(b: bytes, encoding: str, errors: str = "strict") -> str:
+def decode_bytes(b: bytes | mmap.mmap, encoding: str, errors: str = "strict") -> str:
     """
-    Decode bytes with unified BOM semantics:
+    Decode bytes (or any bytes-like buffer, e.g. a map_text_file() mapping)
+    with unified BOM semantics:
       - 'utf-8-with-bom' uses Python's 'utf-8-sig' (strips BOM).
     """
+    # str(buffer, ...) takes any buffer (mmap included) and, unlike codecs.decode,
+    # rejects bytes-to-bytes codecs (hex, base64, zlib, ...) as "not a text encoding"
     enc = (encoding or "").strip().lower()
     if enc == "utf-8-with-bom":
-        return b.decode("utf-8-sig", errors=errors)
-    return b.decode(encoding, errors=errors)
+        return str(b, "utf-8-sig", errors)
+    return str(b, encoding, errors)
 
 def encode_text(text: str, encoding: str, add_bom: bool | None = None) -> bytes:
     """
@@ -95,6 +209,30 @@ def encode_text(text: str, encoding: str, add_bom: bool | None = None) -> bytes:
 
     return text.encode(encoding)
 
+def iter_encoded_chunks(chunks, encoding: str, add_bom: bool | None = None):
+    """
+    Incrementally encode an iterable of str chunks with the same label/BOM
+    semantics as encode_text(), yielding bytes. Peak memory is one chunk.
+    """
+    enc = (encoding or "").strip().lower()
+    if add_bom is None:
+        add_bom = (enc == "utf-8-with-bom")
+
+    if enc in ("utf-8", "utf8", "utf-8-with-bom"):
+        if add_bom:
+            yield b"\xef\xbb\xbf"
+        encoder = codecs.getincrementalencoder("utf-8")()
+    else:
+        encoder = codecs.getincrementalencoder(encoding)()
+
+    for chunk in chunks:
+        data = encoder.encode(chunk)
+        if data:
+            yield data
+    tail = encoder.encode("", final=True)
+    if tail:
+        yield tail
+
 # =============================================================================
 # Simple “maybe” encoding chooser (when you want a quick confirm/override)
 # =============================================================================
@@ -191,6 +329,21 @@ def encode_text_inline(owner: tk.Misc, text: str, default_encoding: str) -> tupl
     Modal encoding picker for 'Save Over'.
     Returns (data: bytes, encoding: str). Raises RuntimeError on cancel.
     """
+    while True:
+        enc = choose_encoding_inline(owner, default_encoding)
+        if enc is None:
+            raise RuntimeError("Canceled")
+        try:
+            return encode_text(text, enc), enc  # BOM inferred from label
+        except Exception as e:
+            messagebox.showerror("Encoding Error", f"Could not encode text:\n{e}", parent=owner)
+            default_encoding = enc
+
+def choose_encoding_inline(owner: tk.Misc, default_encoding: str) -> str | None:
+    """
+    Modal encoding picker for 'Save Over' that only picks the label, so the
+    caller can stream-encode. Returns the encoding, or None on cancel.
+    """
     ENCODINGS = list(_DEF_ENCODINGS)
 
     pal = getattr(owner, "_palette", {})
@@ -218,16 +371,17 @@ def encode_text_inline(owner: tk.Misc, text: str, default_encoding: str) -> tupl
     btns = tk.Frame(frm, bg=bg)
     btns.grid(row=1, column=0, columnspan=2, sticky="e", pady=(14, 0))
 
-    out: dict[str, tuple[bytes, str] | None] = {"res": None}
+    out: dict[str, str | None] = {"res": None}
 
     def ok():
         enc = enc_var.get().strip() or (default_encoding or "utf-8")
         try:
-            data = encode_text(text, enc)  # BOM inferred from label
-        except Exception as e:
-            messagebox.showerror("Encoding Error", f"Could not encode text:\n{e}", parent=win)
+            if enc.lower() != "utf-8-with-bom":
+                codecs.lookup(enc)
+        except LookupError as e:
+            messagebox.showerror("Encoding Error", f"Unknown encoding:\n{e}", parent=win)
             return
-        out["res"] = (data, enc)
+        out["res"] = enc
         win.destroy()
 
     def cancel():
@@ -251,9 +405,6 @@ def encode_text_inline(owner: tk.Misc, text: str, default_encoding: str) -> tupl
     win.lift()
     win.focus_set()
     win.wait_window()
-
-    if out["res"] is None:
-        raise RuntimeError("Canceled")
     return out["res"]
 
 # =============================================================================
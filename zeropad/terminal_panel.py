@@ -1,9 +1,11 @@
 # terminal_panel.py
 import os
+import queue
 import shlex
 import shutil
 import signal
 import subprocess
+import threading
 import time
 import uuid
 import tkinter as tk
@@ -29,6 +31,9 @@ class TerminalPanel:
     POLL_MS = 800              # tmux cwd poll
     SIZE_PERIODIC_MS = 1200    # periodic size reconcile (safety net)
     RESPAWN_COOLDOWN = 1.0     # seconds
+    TMUX_READY_FIRST_MS = 20   # first tmux socket probe (doubles each retry)
+    TMUX_READY_MAX_MS = 600    # give up waiting and let the cwd poll take over
+    TMUX_CTRL_TIMEOUT = 0.5    # seconds to wait for a control-mode reply
 
     # ---------- Activation & global intercept ----------
 
@@ -106,11 +111,7 @@ class TerminalPanel:
     def _tmux_send_ctrl(self, letter: str):
         if not self._tmux_ready:
             return
-        tmux = shutil.which("tmux")
-        if not tmux:
-            return
-        subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "send-keys", f"C-{letter.lower()}"],
-                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        self._tmux_run(["send-keys", f"C-{letter.lower()}"])
 
     # ---------- Lifecycle / spawn ----------
 
@@ -123,30 +124,20 @@ class TerminalPanel:
             self.after(50, self._maybe_spawn_xterm)
             return
 
-        xterm_path = shutil.which("xterm")
-        tmux_path  = shutil.which("tmux")
-        if not xterm_path or not tmux_path:
-            self._show_missing_tools(xterm_path, tmux_path)
-            return
+        if self._xterm_cmd_template is None:
+            xterm_path = shutil.which("xterm")
+            tmux_path  = self._tmux_bin()
+            if not xterm_path or not tmux_path:
+                self._show_missing_tools(xterm_path, tmux_path)
+                return
+            self._xterm_cmd_template = self._build_xterm_cmd_template(xterm_path, tmux_path)
 
         # Container X window id
         self._term_container.update_idletasks()
         wid = self._term_container.winfo_id()
 
-        bg = self._TERM_BG
-        fg = self._TERM_FG
-
-        # Fresh tmux session on private socket
-        tmux_cmd = [tmux_path, "-S", str(self.TMUX_SOCK), "new-session", "-s", self.TMUX_SESSION]
-
-        cmd = [
-            xterm_path,
-            "-into", str(wid),
-            "-fa", "Monospace", "-fs", "11",
-            "-bg", bg, "-fg", fg, "+sb", "-bc", "-cr", fg,
-            "-vb", "-xrm", "XTerm.vt100.bellIsUrgent: false",
-            "-e", *tmux_cmd,
-        ]
+        cmd = list(self._xterm_cmd_template)
+        cmd[self._XTERM_WID_SLOT] = str(wid)
 
         def _preexec():
             os.setsid()
@@ -167,16 +158,48 @@ class TerminalPanel:
             self._show_error(f"Xlib display error: {e}")
             return
 
-        self.after(600, self._mark_tmux_ready_and_prime)
+        self._await_tmux_socket(self.TMUX_READY_FIRST_MS)
+
+    def _await_tmux_socket(self, delay_ms: int):
+        """
+        Wait for tmux to create its private socket, then prime the session.
+        Polls with exponential backoff (20, 40, 80, ... ms) instead of a fixed warm-up.
+        """
+        if not self._xterm_started:
+            return
+        ready = self.TMUX_SOCK.exists() and self._tmux_has_session()
+        if ready or delay_ms > self.TMUX_READY_MAX_MS:
+            self._mark_tmux_ready_and_prime()
+            return
+        self.after(delay_ms, lambda: self._await_tmux_socket(delay_ms * 2))
+
+    # Position of the "-into" window id in the xterm argv template
+    _XTERM_WID_SLOT = 2
+
+    def _build_xterm_cmd_template(self, xterm_path: str, tmux_path: str) -> list[str]:
+        """Build the xterm argv once; the container window id is filled in per spawn."""
+        bg = self._TERM_BG
+        fg = self._TERM_FG
+
+        # Fresh tmux session on private socket
+        tmux_cmd = [tmux_path, "-S", str(self.TMUX_SOCK), "new-session", "-s", self.TMUX_SESSION]
+
+        return [
+            xterm_path,
+            "-into", None,  # window id slot (_XTERM_WID_SLOT)
+            "-fa", "Monospace", "-fs", "11",
+            "-bg", bg, "-fg", fg, "+sb", "-bc", "-cr", fg,
+            "-vb", "-xrm", "XTerm.vt100.bellIsUrgent: false",
+            "-e", *tmux_cmd,
+        ]
 
     def _mark_tmux_ready_and_prime(self):
         self._tmux_ready = self._tmux_has_session()
         if self._tmux_ready:
-            self._tmux_quiet_bell()
+            self._tmux_ctrl_start()
+            self._tmux_prime(self._pending_cd)
+            self._pending_cd = None
             self._client_tty = self._tmux_first_client_tty()
-            if self._pending_cd:
-                self._tmux_cd_to(self._pending_cd)
-                self._pending_cd = None
         self.after(self.POLL_MS, self._poll_tmux_cwd)
         self.after(200, self._discover_xchild)
 
@@ -195,23 +218,14 @@ class TerminalPanel:
                 self._restart_tmux_session()
 
     def _respawn_xterm_and_tmux(self):
-        tmux = shutil.which("tmux")
+        self._tmux_ctrl_stop()
+        tmux = self._tmux_bin()
         if tmux:
             subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "kill-server"],
                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         p = self._xterm_proc
         if p:
-            try:
-                os.killpg(p.pid, signal.SIGTERM)
-            except Exception:
-                pass
-            try:
-                p.wait(timeout=0.6)
-            except Exception:
-                try:
-                    os.killpg(p.pid, signal.SIGKILL)
-                except Exception:
-                    pass
+            self._terminate_xterm(p)
         self._xterm_proc = None
         self._xterm_started = False
         self._tmux_ready = False
@@ -219,21 +233,45 @@ class TerminalPanel:
         self._x_child = None
         self._maybe_spawn_xterm()
 
+    @staticmethod
+    def _terminate_xterm(p: subprocess.Popen, attempts: int = 20, step: float = 0.01):
+        """
+        SIGTERM the xterm process group and reap it with a tight non-blocking
+        poll (waitpid WNOHANG under the hood); escalate to SIGKILL (and a blocking
+        reap) if it lingers.
+        """
+        try:
+            os.killpg(p.pid, signal.SIGTERM)
+        except Exception:
+            pass
+        for _ in range(attempts):
+            try:
+                if p.poll() is not None:
+                    return
+            except Exception:
+                return
+            time.sleep(step)
+        try:
+            os.killpg(p.pid, signal.SIGKILL)
+        except Exception:
+            pass
+        try:
+            p.wait(timeout=0.5)  # SIGKILL can't be ignored; reap so no zombie is left
+        except Exception:
+            pass
+
     def _restart_tmux_session(self):
-        tmux = shutil.which("tmux")
+        tmux = self._tmux_bin()
         if not tmux:
             return
         r = subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "new-session", "-ds", self.TMUX_SESSION],
                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         if r.returncode == 0:
             self._tmux_ready = True
-            self._tmux_quiet_bell()
+            self._tmux_ctrl_start()
+            cwd = getattr(self, "cwd", None)
+            self._tmux_prime(Path(cwd) if cwd else None)
             self._client_tty = self._tmux_first_client_tty()
-            try:
-                if getattr(self, "cwd", None):
-                    self._tmux_cd_to(Path(self.cwd))
-            except Exception:
-                pass
 
     # ---------- Timers ----------
 
@@ -321,101 +359,245 @@ class TerminalPanel:
 
     # ---------- tmux helpers (private socket -S) ----------
 
-    def _tmux_has_session(self) -> bool:
-        tmux = shutil.which("tmux")
-        if not tmux:
-            return False
-        r = subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "has-session", "-t", self.TMUX_SESSION],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
-        return r.returncode == 0
+    def _tmux_bin(self) -> str | None:
+        """Resolve the tmux binary once per run (PATH lookups are not free)."""
+        if self._tmux_path is None:
+            self._tmux_path = shutil.which("tmux") or ""
+        return self._tmux_path or None
 
-    def _tmux_first_client_tty(self) -> str | None:
-        tmux = shutil.which("tmux")
+    def _tmux_run(self, *commands: list[str], capture: bool = False,
+                  allow_ctrl: bool = True) -> tuple[bool, str]:
+        """
+        Run one or more tmux commands and return (ok, stdout).
+        Goes over the persistent control-mode client when it is up; otherwise
+        falls back to a one-shot client using tmux's ';'-separated sequence
+        syntax (one fork for the whole batch).
+        """
+        if not commands:
+            return True, ""
+        if allow_ctrl and self._tmux_ctrl_alive():
+            res = self._tmux_ctrl_send(commands)
+            if res is not None:
+                return res
+        tmux = self._tmux_bin()
         if not tmux:
-            return None
-        r = subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "list-clients", "-t", self.TMUX_SESSION,
-                            "-F", "#{client_tty}"], stdout=subprocess.PIPE,
+            return False, ""
+        args = [tmux, "-S", str(self.TMUX_SOCK)]
+        for i, cmd in enumerate(commands):
+            if i:
+                args.append(";")
+            args.extend(cmd)
+        r = subprocess.run(args, stdout=subprocess.PIPE if capture else subprocess.DEVNULL,
                            stderr=subprocess.DEVNULL, text=True, check=False)
-        lines = [ln.strip() for ln in (r.stdout or "").splitlines() if ln.strip()]
-        return lines[0] if lines else None
+        return r.returncode == 0, (r.stdout or "") if capture else ""
+
+    def _tmux_has_session(self) -> bool:
+        ok, _ = self._tmux_run(["has-session", "-t", self.TMUX_SESSION])
+        return ok
+
+    def _tmux_first_client_tty(self) -> str | None:
+        # Skip our own control-mode client; only the xterm-attached client has a real grid.
+        _ok, out = self._tmux_run(["list-clients", "-t", self.TMUX_SESSION,
+                                   "-F", "#{client_control_mode} #{client_tty}"], capture=True)
+        for ln in out.splitlines():
+            ctrl, _, tty = ln.strip().partition(" ")
+            if tty and ctrl != "1":
+                return tty
+        return None
 
     def _tmux_get_cwd(self) -> str | None:
-        tmux = shutil.which("tmux")
-        if not tmux:
-            return None
-        r = subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "display-message",
-                            "-t", self.TMUX_SESSION, "-p", "-F", "#{pane_current_path}"],
-                           stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=False)
-        s = (r.stdout or "").strip()
+        _ok, out = self._tmux_run(["display-message", "-t", self.TMUX_SESSION,
+                                   "-p", "-F", "#{pane_current_path}"], capture=True)
+        s = out.strip()
         return s or None
 
     def _tmux_get_client_size(self):
-        tmux = shutil.which("tmux")
-        if not tmux:
-            return None, None
-        args = [tmux, "-S", str(self.TMUX_SOCK), "display-message", "-p"]
+        args = ["display-message", "-p"]
         if self._client_tty:
             args += ["-t", self._client_tty]
         args += ["-F", "#{client_width} #{client_height}"]
-        r = subprocess.run(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
-                           text=True, check=False)
-        out = (r.stdout or "").strip().split()
+        # Without an explicit client, the control client would answer for itself.
+        _ok, out = self._tmux_run(args, capture=True, allow_ctrl=bool(self._client_tty))
+        out = out.strip().split()
         if len(out) == 2:
             return int(out[0]), int(out[1])
         return None, None
 
     def _tmux_get_pane_size(self):
-        tmux = shutil.which("tmux")
-        if not tmux:
-            return None, None
-        r = subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "display-message",
-                            "-t", self.TMUX_SESSION, "-p", "-F", "#{pane_width} #{pane_height}"],
-                           stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=False)
-        out = (r.stdout or "").strip().split()
+        _ok, out = self._tmux_run(["display-message", "-t", self.TMUX_SESSION,
+                                   "-p", "-F", "#{pane_width} #{pane_height}"], capture=True)
+        out = out.strip().split()
         if len(out) == 2:
             return int(out[0]), int(out[1])
         return None, None
 
     def _tmux_refresh_client(self, cols: int, rows: int):
-        tmux = shutil.which("tmux")
-        if not tmux:
-            return
-        args = [tmux, "-S", str(self.TMUX_SOCK), "refresh-client", "-C", f"{cols},{rows}"]
+        args = ["refresh-client", "-C", f"{cols},{rows}"]
         if self._client_tty:
-            args[4:4] = ["-t", self._client_tty]
-        subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+            args[1:1] = ["-t", self._client_tty]
+        # Never let a size request land on the control client itself.
+        self._tmux_run(args, allow_ctrl=bool(self._client_tty))
 
-    def _tmux_cd_to(self, path: Path):
-        tmux = shutil.which("tmux")
+    # ---------- tmux control-mode client (one persistent pipe, no per-call fork) ----------
+
+    def _tmux_ctrl_alive(self) -> bool:
+        c = self._tmux_ctrl
+        return c is not None and c.poll() is None
+
+    def _tmux_ctrl_start(self):
+        """Attach a `tmux -C` client to our session and sync to its reply stream."""
+        self._tmux_ctrl_stop()
+        tmux = self._tmux_bin()
         if not tmux:
             return
+        try:
+            proc = subprocess.Popen(
+                [tmux, "-S", str(self.TMUX_SOCK), "-C", "attach-session", "-t", self.TMUX_SESSION],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            )
+        except Exception:
+            return
+        replies: queue.Queue = queue.Queue()
+        threading.Thread(target=self._tmux_ctrl_reader, args=(proc.stdout, replies),
+                         name="zeropad-tmux-ctrl", daemon=True).start()
+        self._tmux_ctrl = proc
+        self._tmux_ctrl_replies = replies
+        self._tmux_ctrl_stale = 0
+
+        # Replies are matched to requests purely by order, so discard anything tmux
+        # emitted before our first command (e.g. the attach reply) using a sentinel.
+        marker = f"zeropad-sync-{uuid.uuid4().hex[:8]}"
+        if not self._tmux_ctrl_write(f"display-message -p {marker}"):
+            self._tmux_ctrl_stop()
+            return
+        deadline = time.monotonic() + self.TMUX_CTRL_TIMEOUT
+        while True:
+            try:
+                _ok, lines = replies.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                self._tmux_ctrl_stop()
+                return
+            if marker in lines:
+                break
+        # Don't stream pane output to us (tmux >= 3.2; older servers just reply %error).
+        self._tmux_ctrl_send([["refresh-client", "-f", "no-output"]])
+
+    def _tmux_ctrl_stop(self):
+        c = self._tmux_ctrl
+        self._tmux_ctrl = None
+        self._tmux_ctrl_replies = None
+        if c is None:
+            return
+        try:
+            c.stdin.close()  # control client detaches on EOF
+        except Exception:
+            pass
+        try:
+            c.wait(timeout=0.2)
+        except Exception:
+            try:
+                c.kill()
+                c.wait(timeout=0.2)
+            except Exception:
+                pass
+
+    @staticmethod
+    def _tmux_ctrl_reader(stream, replies: queue.Queue):
+        """Reader thread: turn %begin/%end|%error framed blocks into (ok, lines) replies."""
+        block: list[str] | None = None
+        try:
+            for raw in iter(stream.readline, b""):
+                line = os.fsdecode(raw.rstrip(b"\r\n"))
+                if block is None:
+                    if line.startswith("%begin"):
+                        block = []
+                    continue  # async notifications (%output, %window-*, ...) are ignored
+                if line.startswith("%end") or line.startswith("%error"):
+                    replies.put((line.startswith("%end"), block))
+                    block = None
+                else:
+                    block.append(line)
+        except Exception:
+            pass
+
+    def _tmux_ctrl_write(self, line: str) -> bool:
+        try:
+            self._tmux_ctrl.stdin.write(os.fsencode(line) + b"\n")
+            self._tmux_ctrl.stdin.flush()
+            return True
+        except Exception:
+            self._tmux_ctrl_stop()
+            return False
+
+    def _tmux_ctrl_send(self, commands) -> tuple[bool, str] | None:
+        """
+        Send the commands (one per line, in a single write) and wait for their
+        replies; None means 'fall back'. Each line gets exactly one %begin/%end
+        block, so one reply per command is consumed (ok only if all succeeded).
+        """
+        lines = [" ".join(shlex.quote(a) for a in cmd) for cmd in commands]
+        if any("\n" in ln or "\r" in ln for ln in lines):
+            return None  # would break the line-oriented protocol
+        replies = self._tmux_ctrl_replies
+        if not self._tmux_ctrl_write("\n".join(lines)):
+            return None
+        deadline = time.monotonic() + self.TMUX_CTRL_TIMEOUT
+        pending = len(commands)
+        all_ok, out = True, []
+        while pending:
+            try:
+                ok, reply = replies.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                # Late replies will arrive eventually; remember to drop them.
+                self._tmux_ctrl_stale += pending
+                return None
+            if self._tmux_ctrl_stale > 0:
+                self._tmux_ctrl_stale -= 1
+                continue
+            pending -= 1
+            all_ok = all_ok and ok
+            out.extend(reply)
+        return all_ok, "\n".join(out)
+
+    @staticmethod
+    def _tmux_cd_cmds(path: Path) -> list[list[str]]:
+        """Clear the prompt line, type `cd -- <path>`, run it, and clear the screen."""
         q = shlex.quote(str(path))
+        return [
+            ["send-keys", "C-u", "C-k"],
+            ["send-keys", "-l", f"cd -- {q}"],
+            ["send-keys", "Enter", "C-l"],
+        ]
+
+    _TMUX_QUIET_BELL_CMDS = [
+        ["set-option", "-g", "bell-action", "none"],
+        ["set-option", "-g", "visual-activity", "off"],
+        ["set-option", "-g", "monitor-activity", "off"],
+    ]
+
+    def _tmux_cd_to(self, path: Path):
         try:
-            subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "send-keys", "C-u"],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
-            subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "send-keys", "C-k"],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
-            subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "send-keys", "-l", f"cd -- {q}"],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
-            subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "send-keys", "Enter"],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
-            subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "send-keys", "C-l"],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
-            self._last_tmux_cwd = Path(path).resolve()
+            self._tmux_run(*self._tmux_cd_cmds(path))
+            self._note_app_cd(path)
         except Exception:
             pass
 
-    def _tmux_quiet_bell(self):
-        tmux = shutil.which("tmux")
-        if not tmux:
-            return
-        for args in [
-            ["set-option", "-g", "bell-action", "none"],
-            ["set-option", "-g", "visual-activity", "off"],
-            ["set-option", "-g", "monitor-activity", "off"],
-        ]:
-            subprocess.run([tmux, "-S", str(self.TMUX_SOCK), *args],
-                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    def _note_app_cd(self, path: Path):
+        """Remember an app-pushed cd and skip the next poll, which would only read it back."""
+        self._last_tmux_cwd = Path(path).resolve()
+        self._skip_polls = 1
+
+    def _tmux_prime(self, cd_path: Path | None):
+        """Quiet the bell and (optionally) cd, all in a single tmux invocation."""
+        cmds = list(self._TMUX_QUIET_BELL_CMDS)
+        if cd_path is not None:
+            cmds += self._tmux_cd_cmds(cd_path)
+        try:
+            self._tmux_run(*cmds)
+            if cd_path is not None:
+                self._note_app_cd(cd_path)
+        except Exception:
+            pass
 
     # ---------- UI helpers ----------
 
@@ -449,6 +631,11 @@ class TerminalPanel:
             if not self.winfo_exists():
                 return
 
+            # The app just pushed a cd; this poll would only echo it back.
+            if self._skip_polls > 0:
+                self._skip_polls -= 1
+                return
+
             self._ensure_alive()
             if not self._tmux_ready:
                 self._tmux_ready = self._tmux_has_session()
@@ -456,6 +643,7 @@ class TerminalPanel:
                 pane_cwd = self._tmux_get_cwd()
                 if pane_cwd:
                     p = Path(pane_cwd).resolve()
+                    # An app-pushed cd already set _last_tmux_cwd, so its echo is a no-op here
                     if self._last_tmux_cwd is None or p != self._last_tmux_cwd:
                         self._last_tmux_cwd = p
                         # Only push to Zeropad when it differs (avoid loops)
@@ -525,104 +713,12 @@ class TerminalPanel:
         # Terminate xterm process group (if still present)
         p = getattr(self, "_xterm_proc", None)
         if p:
-            try:
-                os.killpg(p.pid, signal.SIGTERM)
-            except Exception:
-                pass
-            try:
-                p.wait(timeout=1.0)
-            except Exception:
-                try:
-                    os.killpg(p.pid, signal.SIGKILL)
-                except Exception:
-                    pass
+            self._terminate_xterm(p)
             self._xterm_proc = None
 
-        # Kill tmux server on the private socket
-        tmux = shutil.which("tmux")
-        if tmux:
-            try:
-                subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "kill-server"],
-                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
-            except Exception:
-                pass
-
-        # Close X display (if open)
-        try:
-            if getattr(self, "_x_dpy", None) is not None:
-                self._x_dpy.close()
-        except Exception:
-            pass
-        self._x_dpy = None
-        self._x_child = None
-
-        # Remove the private tmux dir
-        try:
-            if hasattr(self, "TMUX_DIR") and self.TMUX_DIR.exists():
-                for entry in self.TMUX_DIR.iterdir():
-                    try:
-                        entry.unlink()
-                    except Exception:
-                        pass
-                self.TMUX_DIR.rmdir()
-        except Exception:
-            pass
-
-        # Reset state
-        self._xterm_started = False
-        self._tmux_ready = False
-        self._last_tmux_cwd = None
-        self._pending_cd = None
-        self._client_tty = None
-
-    def _terminal_cleanup(self):
-        """
-        Stop timers, remove high-priority intercept tags, kill xterm/tmux, and
-        clean tmp resources. Idempotent and safe to call multiple times.
-        """
-        # Cancel timers first to stop rescheduling loops
-        for after_id_attr in ("_poll_after_id", "_size_after_id"):
-            aid = getattr(self, after_id_attr, None)
-            if aid:
-                try:
-                    self.after_cancel(aid)
-                except Exception:
-                    pass
-                setattr(self, after_id_attr, None)
-
-        # Remove intercept tag from all widgets so global shortcuts return to normal
-        if self._intercept_installed:
-            try:
-                for w in self._walk_widgets(self):
-                    try:
-                        tags = list(w.bindtags())
-                        if self._intercept_tag in tags:
-                            tags.remove(self._intercept_tag)
-                            w.bindtags(tuple(tags))
-                    except Exception:
-                        continue
-            except Exception:
-                pass
-            self._intercept_installed = False
-
-        # Terminate xterm process group (if still present)
-        p = getattr(self, "_xterm_proc", None)
-        if p:
-            try:
-                os.killpg(p.pid, signal.SIGTERM)
-            except Exception:
-                pass
-            try:
-                p.wait(timeout=1.0)
-            except Exception:
-                try:
-                    os.killpg(p.pid, signal.SIGKILL)
-                except Exception:
-                    pass
-            self._xterm_proc = None
-
-        # Kill tmux server on the private socket
-        tmux = shutil.which("tmux")
+        # Detach the control-mode client, then kill tmux server on the private socket
+        self._tmux_ctrl_stop()
+        tmux = self._tmux_bin()
         if tmux:
             try:
                 subprocess.run([tmux, "-S", str(self.TMUX_SOCK), "kill-server"],
@@ -655,6 +751,7 @@ class TerminalPanel:
         self._xterm_started = False
         self._tmux_ready = False
         self._last_tmux_cwd = None
+        self._skip_polls = 0
         self._pending_cd = None
         self._client_tty = None
 
@@ -688,12 +785,22 @@ class TerminalPanel:
         self._tmux_ready = False
         self._last_tmux_cwd: Path | None = None
         self._pending_cd: Path | None = None
+        self._skip_polls = 0
 
         # Size tracking
         self._cell_w = 8.0
         self._cell_h = 16.0
         self._client_tty: str | None = None
 
+        # Resolved binaries / prebuilt xterm argv (filled lazily on first spawn)
+        self._tmux_path: str | None = None
+        self._xterm_cmd_template: list | None = None
+
+        # Persistent tmux control-mode client (see _tmux_ctrl_start)
+        self._tmux_ctrl: subprocess.Popen | None = None
+        self._tmux_ctrl_replies: queue.Queue | None = None
+        self._tmux_ctrl_stale = 0
+
         # Xlib
         self._x_dpy = None
         self._x_child = None
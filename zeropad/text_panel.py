@@ -1,6 +1,9 @@
 # text_panel.py
 from __future__ import annotations
+import functools
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional, List, Tuple, Set
 
@@ -8,8 +11,27 @@ import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, messagebox, filedialog
 
-from basic_string_safety_utils import suspicious_line, exists_outside_printable_ascii_plane
-from editor_io import *
+from basic_string_safety_utils import (
+    graphemes,
+    looks_like_ascii,
+    apparent_width,
+    contains_ascii_control_chars,
+    confusable_skeleton,
+)
+from editor_io import (
+    read_text_bytes,
+    map_text_file,
+    save_to_path,
+    save_chunks_to_path,
+    save_over_file,
+    suggest_open_encoding,
+    decode_bytes,
+    encode_text,
+    iter_encoded_chunks,
+    prompt_open_with_encoding,
+    choose_encoding_inline,
+    prompt_save_as_with_encoding,
+)
 
 # =========================
 # Palette / Theme Constants
@@ -27,9 +49,35 @@ SAFE_FACE_MED = "😐"
 SAFE_FACE_OK  = "🙂"
 
 # Repaint throttles
-REPAINT_FAST_MS = 60
-REPAINT_SLOW_MS = 140
-REPAINT_HUGE_MS = 260
+REPAINT_MIN_MS = 20
+REPAINT_MAX_MS = 260
+
+# Bulk document insert (see TextPanel._insert_bulk)
+BULK_INSERT_THRESHOLD = 256 * 1024   # chars; smaller docs go in with one insert
+BULK_INSERT_CHUNK     = 64 * 1024
+BULK_INSERT_YIELD_EVERY = 16         # chunks (~1 Mi chars) between progress/redraw yields
+
+# Larger buffers are saved by streaming line chunks (see TextPanel._save_tab_to_path)
+STREAM_SAVE_THRESHOLD = 256 * 1024   # chars
+
+# Lines made only of TAB + printable ASCII are always SAFE_FACE_OK (gutter fast path)
+_ASCII_SAFE_LINE = re.compile(r"[\x09\x20-\x7E]*")
+# Any char outside TAB/LF/printable ASCII: the only places a visible slab needs a real check
+_NOT_ASCII_SAFE = re.compile(r"[^\x09\x0A\x20-\x7E]")
+
+# Memoized per-line face classifications (content-keyed, so edits never need invalidation);
+# bounds both the worker's font-free prescan and the UI thread's measured faces
+FACE_CACHE_SIZE = 20000
+
+# Off-canvas y for parked (unused) pooled gutter items
+_POOL_PARKED_Y = -100
+
+# Presses on the '+' tab closer together than this create only one new tab
+PLUS_CLICK_DEBOUNCE_NS = 30_000_000
+
+# Encodings in which bytes 0x0D/0x0A only ever mean CR/LF, so EOLs can be
+# normalized on the raw bytes before decoding (not true for UTF-16 etc.)
+_EOL_BYTES_SAFE = {"utf-8", "utf-8-with-bom", "ascii", "latin-1", "iso8859-1", "cp1252", "windows-1252"}
 
 # Injectivity recompute minima (heavier O(n) work)
 INJ_MIN_INTERVAL_SMALL = 0.30   # seconds (small/medium files)
@@ -126,12 +174,45 @@ class TextPanel:
             self._status, text="", bg=DARK_PANEL_2, fg=FG_DIM, padx=8
         )
         self._status_info.pack(side="right")
+        self._status_last = ("", "")  # (path text, info text) last pushed to the labels
 
         # Tabs model: tid -> dict
         self._tabs: Dict[int, Dict] = {}
+        self._next_tid = 0
+        self._tabs_by_widget: Dict[str, Dict] = {}  # str(frame) -> tab (reverse index)
+        self._tids_by_path: Dict[Path, Set[int]] = {}  # resolved path -> tids (see _set_tab_path)
+
+        # Single worker for the per-line safety scan (keeps the UI thread free)
+        self._scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zeropad-scan")
+        # File reads/decodes for open & revert (slow disks/network mounts must not freeze Tk)
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="zeropad-io")
+        self._opens_in_flight = 0
+        self._pending_opens: List[Tuple[Path, object]] = []  # (path, finished future)
+        self._pending_opens_armed = False
+        if not hasattr(self, "_cleanup_hooks"):
+            self._cleanup_hooks = []
+        self._cleanup_hooks.append(self._text_panel_cleanup)
+
+        # One monospace font shared by every tab (one Tcl font, one metrics cache)
+        self._mono_font = tkfont.Font(family="Monospace", size=11)
+        self._line_h = self._mono_font.metrics("linespace")  # uniform line height (wrap="none")
+        # Line numbers are drawn in that font too; size the gutter for 6 digits
+        self._ln_gutter_w = max(48, self._mono_font.measure("000000") + 8)
+        # Faces that needed glyph widths, keyed on (line, font); UI thread only
+        self._face_cache: Dict[Tuple[str, Tuple], str] = {}
+        self._face_font_key = (self._mono_font.actual("family"), self._mono_font.actual("size"))
+
+        # Deferred squelch ends (see _queue_squelch_settle)
+        self._settle_queue: List[Dict] = []
+        self._settle_armed = False
+
+        # Gutter repaint coalescer (see _schedule_draw_gutters / _drain_repaints)
+        self._dirty_tids: Set[int] = set()
+        self._repaint_after_id = None
 
         # Fixed "+" tab at index 0
         self._plus_tab = tk.Frame(self._nb, bg=DARK_PANEL)
+        self._plus_tab_str = str(self._plus_tab)  # widget path, compared against nb.select()
         self._nb.add(self._plus_tab, text="  +  ")
         self._nb.enable_traversal()
         self._nb.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
@@ -142,8 +223,10 @@ class TextPanel:
         # Create initial empty tab
         self._create_empty_tab_and_select()
 
-        # Convenience: expose open_with_zeropad for FilePanel
-        self.open_with_zeropad = self.open_with_zeropad
+    def _text_panel_cleanup(self):
+        """Stop the scan/I-O workers; pending jobs are dropped. Safe to call multiple times."""
+        self._scan_pool.shutdown(wait=False, cancel_futures=True)
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
 
     # =====================================================================
     # Public actions (Menus call these)
@@ -211,26 +294,25 @@ class TextPanel:
 
     def _on_tab_changed(self, _evt):
         # Auto-create a new tab if the '+' tab is selected
-        if self._nb.select() == str(self._plus_tab):
+        if self._nb.select() == self._plus_tab_str:
             self._create_empty_tab_and_select()
-        # Repaint gutters promptly
+        # Only the visible tab repaints its gutters; background tabs just track dirtiness
         tab = self._current_tab()
+        for t in self._tabs.values():
+            t["active"] = t is tab
+        # Repaint gutters promptly
         if tab:
-            self._schedule_draw_gutters(id(tab["frame"]), fast=True)
+            self._schedule_draw_gutters(tab["tid"], fast=True)
 
     def _close_current_tab(self):
         cur = self._nb.select()
-        if not cur or cur == str(self._plus_tab):
+        if not cur or cur == self._plus_tab_str:
             return
         self._close_tab_by_widget(cur)
 
     def _close_tab_by_widget(self, tab_widget: str):
         # Resolve tab dict
-        tab = None
-        for tid, t in self._tabs.items():
-            if str(t["frame"]) == tab_widget:
-                tab = t
-                break
+        tab = self._tabs_by_widget.get(tab_widget)
         if not tab:
             return
 
@@ -255,9 +337,15 @@ class TextPanel:
                 if tab["dirty"]:
                     return
 
-        # Close
+        # Close (and destroy: a forgotten page keeps its Text and buffer alive)
         self._nb.forget(tab_widget)
-        self._tabs.pop(id(tab["frame"]), None)
+        self._invalidate_plus_bbox()
+        self._tabs.pop(tab["tid"], None)
+        self._tabs_by_widget.pop(tab_widget, None)
+        self._unindex_tab_path(tab)
+        if tab["scan_fut"] is not None:
+            tab["scan_fut"].cancel()
+        tab["frame"].destroy()
 
     # =====================================================================
     # Status / gutters / activity
@@ -267,46 +355,118 @@ class TextPanel:
         tab = self._tabs.get(tid)
         if not tab:
             return
+        t0 = time.perf_counter()
         ln: tk.Canvas = tab["ln"]
-        face: tk.Canvas = tab["face"]
         txt: tk.Text = tab["text"]
 
-        ln.delete("all")
-        face.delete("all")
-
         # Visible line range
         first_idx = txt.index("@0,0")
         last_idx = txt.index(f"@0,{txt.winfo_height()}")
         first_line = int(first_idx.split(".")[0])
         last_line = max(first_line, int(last_idx.split(".")[0]))
 
-        # Font to pass to suspicious_line (Tk font object)
+        # Monospace + wrap="none" → uniform line height: one dlineinfo for the top
+        # line, then y = y0 + k * fh (no per-line layout queries). An unmapped Text
+        # has no display lines; bail before fetching any text.
+        dline0 = txt.dlineinfo(f"{first_line}.0")
+        if not dline0:
+            return
+        y0 = dline0[1]
+        fh = self._line_h
+
+        # One Tk round-trip for the whole visible slice
+        block = txt.get(f"{first_line}.0", f"{last_line}.end")
+
+        # Nothing moved and nothing changed since the last paint → keep it
+        paint_key = (first_line, last_line, y0, fh, block)
+        if paint_key == tab["paint_key"]:
+            return
+        tab["paint_key"] = paint_key
+
+        # Line numbers are cheap → draw synchronously, as ONE right-justified
+        # multi-line item in the Text's own font (its line spacing is exactly fh),
+        # so a paint is two Tcl calls however many rows are visible
+        numbers = "\n".join(map(str, range(first_line, last_line + 1)))
+        item = tab["ln_item"]
+        if item is None:
+            tab["ln_item"] = ln.create_text(
+                self._ln_gutter_w - 4, y0, anchor="ne", justify="right", fill=FG_DIM, font=self._mono_font, text=numbers
+            )
+        else:
+            ln.coords(item, self._ln_gutter_w - 4, y0)
+            ln.itemconfigure(item, text=numbers)
+
+        # Safety faces are classified on the scan worker, then applied on the UI thread
+        prev_fut = tab["scan_fut"]
+        if prev_fut is not None:
+            prev_fut.cancel()
+        fut = self._scan_pool.submit(self._line_faces_for, block)
+        tab["scan_fut"] = fut
+
+        def _done(f, tid=tid, first_line=first_line, y0=y0, fh=fh, t0=t0):
+            try:
+                self.after_idle(self._apply_scan_result, tid, f, first_line, y0, fh, t0)
+            except (RuntimeError, tk.TclError):
+                pass  # app is shutting down
+
+        fut.add_done_callback(_done)
+
+    def _apply_scan_result(self, tid: int, fut, first_line: int, y0: int, fh: int, t0: float):
+        """Place safety faces for a finished scan (UI thread); stale scans are dropped."""
+        tab = self._tabs.get(tid)
+        if not tab or tab["scan_fut"] is not fut or fut.cancelled():
+            return
+        tab["scan_fut"] = None
         try:
-            tk_font = tkfont.Font(font=txt["font"])
+            faces = fut.result()
         except Exception:
-            tk_font = tkfont.nametofont("TkFixedFont")
+            return
+        face: tk.Canvas = tab["face"]
 
-        for line_no in range(first_line, last_line + 1):
-            dline = txt.dlineinfo(f"{line_no}.0")
-            if not dline:
+        # Flagged lines take consecutive pooled items; the rest of the pool is parked
+        pool, state = tab["face_pool"], tab["face_state"]
+        used = 0
+        for i, face_char in enumerate(faces):
+            if face_char == SAFE_FACE_OK:
                 continue
-            y = dline[1]
-
-            # Line number (right aligned)
-            ln.create_text(44, y, anchor="ne", fill=FG_DIM, text=str(line_no))
+            if type(face_char) is tuple:
+                face_char = self._measured_face(*face_char)
+            fill = FG_WARN if face_char == SAFE_FACE_BAD else FG_DIM
+            self._pool_put(face, pool, state, used, 9, y0 + i * fh, face_char, fill, "n")
+            used += 1
+        self._pool_hide_from(face, pool, state, used, 9)
 
-            # Safety face
-            text_line = txt.get(f"{line_no}.0", f"{line_no}.end")
-            face_char = self._line_face_for(text_line, tk_font)
+        # End-to-end paint cost (sync part + scan + apply) drives the next repaint delay
+        tab["paint_ms"] = (time.perf_counter() - t0) * 1000.0
+        tab["paint_at"] = time.monotonic()
 
-            if face_char != SAFE_FACE_OK:
-                fill = FG_WARN if face_char == SAFE_FACE_BAD else FG_DIM
-                face.create_text(9, y, anchor="n", fill=fill, text=face_char, tags=("face", f"line-{line_no}"))
+    @staticmethod
+    def _pool_put(cv: tk.Canvas, pool: List[int], state: List[Tuple[int, str, str]], i: int,
+                  x: int, y: int, text: str, fill: str, anchor: str, tags: Tuple[str, ...] = ()):
+        """
+        Show `text` at (x, y) using pooled canvas item i (created on demand).
+        Existing items are only touched (coords/itemconfigure) when something changed.
+        """
+        if i == len(pool):
+            pool.append(cv.create_text(x, y, anchor=anchor, fill=fill, text=text, tags=tags))
+            state.append((y, text, fill))
+            return
+        item = pool[i]
+        prev_y, prev_text, prev_fill = state[i]
+        if prev_y != y:
+            cv.coords(item, x, y)
+        if prev_text != text or prev_fill != fill:
+            cv.itemconfigure(item, text=text, fill=fill)
+        state[i] = (y, text, fill)
 
-        # Click handling
-        def click_cb(ev):
-            self._on_face_click(tid, ev)
-        face.tag_bind("face", "<Button-1>", click_cb)
+    @staticmethod
+    def _pool_hide_from(cv: tk.Canvas, pool: List[int], state: List[Tuple[int, str, str]], n: int, x: int):
+        """Park pooled items n.. off-canvas instead of deleting them."""
+        for i in range(n, len(pool)):
+            prev_y, prev_text, prev_fill = state[i]
+            if prev_y != _POOL_PARKED_Y:
+                cv.coords(pool[i], x, _POOL_PARKED_Y)
+                state[i] = (_POOL_PARKED_Y, prev_text, prev_fill)
 
     def _on_text_activity(self, tid: int):
         tab = self._tabs.get(tid)
@@ -315,60 +475,179 @@ class TextPanel:
         self._update_status_for_tab(tab)
         self._schedule_draw_gutters(tid, fast=True)
 
+    # Event adapters for functools.partial bindings (tid first, Tk event last)
+    def _on_text_activity_evt(self, tid: int, _evt):
+        self._on_text_activity(tid)
+
+    def _schedule_draw_gutters_evt(self, tid: int, _evt):
+        self._schedule_draw_gutters(tid)
+
+    def _on_modified_evt(self, tid: int, _evt):
+        self._on_modified(tid)
+
+    @staticmethod
+    def _swallow_evt(_evt):
+        return "break"
+
+    def _select_all_evt(self, tid: int, _evt):
+        tab = self._tabs.get(tid)
+        if tab:
+            tab["text"].tag_add("sel", "1.0", "end-1c")
+        return "break"
+
     def _on_text_yscroll(self, tid: int, first: str, last: str):
         tab = self._tabs.get(tid)
         if not tab:
             return
         try:
             tab["scroll"].set(first, last)
-            f = float(first)
-            for cv in (tab["ln"], tab["face"]):
-                cv.yview_moveto(f)
         except Exception:
             pass
+        # The gutters are painted in Text pixel coordinates (canvas origin stays 0),
+        # so only a changed view needs a repaint. The top line alone isn't enough:
+        # Tk 8.6 wheel-scrolls by pixels, which moves rows without changing it.
+        if (first, last) == tab["yview_last"]:
+            return
+        tab["yview_last"] = (first, last)
+        # No per-event throttle: scheduling is O(1) (a set add while a drain is
+        # pending), and skipping an event could drop the last view of a burst
+        # when a leading-edge drain has already run.
         self._schedule_draw_gutters(tid, fast=True)
 
     def _schedule_draw_gutters(self, tid: int, fast: bool = False):
         tab = self._tabs.get(tid)
-        if not tab:
+        if not tab or not tab["active"]:
             return
-        txt: tk.Text = tab["text"]
 
-        # Estimate size to scale repaint frequency
-        size_chars = len(txt.get("1.0", "end-1c"))
-        if size_chars > 1_000_000:
-            delay = REPAINT_HUGE_MS
-        elif size_chars > 200_000:
-            delay = REPAINT_SLOW_MS
-        else:
-            delay = REPAINT_FAST_MS
+        # Coalesce: every tab marks itself dirty; one shared timer drains them all.
+        # While that timer is armed, further requests only set the dirty flag
+        # (no after_cancel/after churn per keystroke or wheel tick).
+        self._dirty_tids.add(tid)
+        if self._repaint_after_id is not None:
+            return
+
+        # Adaptive rate: repaint no more often than twice the last paint's cost
+        delay = int(tab["paint_ms"] * 2)
         if fast:
-            delay = max(20, delay // 2)
+            delay //= 2
+        delay = max(REPAINT_MIN_MS, min(REPAINT_MAX_MS, delay))
+        # Leading edge: if the tab has been quiet for a full delay, paint on the next
+        # idle (same frame) so the first event of a burst shows at once; otherwise
+        # wait out only the rest of the delay, and the burst's tail rides that timer.
+        wait = delay - int((time.monotonic() - tab["paint_at"]) * 1000.0)
+        if wait <= 0:
+            self._repaint_after_id = self.after_idle(self._drain_repaints)
+        else:
+            self._repaint_after_id = self.after(wait, self._drain_repaints)
+
+    def _drain_repaints(self):
+        """Repaint the gutters of every tab marked dirty since the last drain."""
+        self._repaint_after_id = None
+        dirty, self._dirty_tids = self._dirty_tids, set()
+        for tid in dirty:
+            # A tab switched away from since it was marked is repainted by
+            # _on_tab_changed when it comes back; painting hidden canvases is waste
+            tab = self._tabs.get(tid)
+            if tab and tab["active"]:
+                self._draw_gutters(tid)
+                # Edits without a key/button release (middle-click paste, drops,
+                # legend sanitize) land here too: keep line count and Ln/Col current
+                self._update_status_for_tab(tab)
+
+    # Face rules for one line:
+    #   - ASCII control chars, or the line only *pretends* to be ASCII (every
+    #     non-ASCII grapheme is a look-alike or renders zero-width) -> 😡
+    #   - elif anything outside printable ASCII -> 😐
+    #   - else -> 🙂
+    # Everything but the glyph widths is font-free and runs on the scan worker
+    # (_prescan_line); widths are Tk calls, so they're measured on the UI thread
+    # (_measured_face) and only for lines the prescan couldn't settle.
 
-        if tab["repaint_due"]:
-            self.after_cancel(tab["repaint_due"])
-        tab["repaint_due"] = self.after(delay, lambda t=tid: self._draw_gutters(t))
+    @staticmethod
+    def _line_faces_for(block: str) -> List:
+        """
+        Prescan every line of a newline-joined slab; result is aligned by line.
+        One C-level regex scan over the whole slab finds the lines holding anything
+        outside TAB/printable ASCII; only those reach _prescan_line.
+        """
+        lines = block.split("\n")
+        faces = [SAFE_FACE_OK] * len(lines)
+        search = _NOT_ASCII_SAFE.search
+        line_no, pos = 0, 0
+        m = search(block)
+        while m is not None:
+            start = m.start()
+            line_no += block.count("\n", pos, start)
+            faces[line_no] = TextPanel._prescan_line(lines[line_no])
+            pos = block.find("\n", start)
+            if pos < 0:
+                break
+            m = search(block, pos + 1)  # resume on the next line
+        return faces
 
-    def _line_face_for(self, text_line: str, tk_font: tkfont.Font) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=FACE_CACHE_SIZE)
+    def _prescan_line(text_line: str):
         """
-        Minimal rules:
-        - suspicious_line(...) -> 😡
-        - elif exists_outside_printable_ascii_plane(...) -> 😐
-        - else -> 🙂
+        Font-free part of the face rules (worker-safe, memoized on line text).
+        Returns a face, or (line, graphemes) when the verdict hinges on whether
+        any of those non-look-alike graphemes actually renders with some width.
         """
+        if _ASCII_SAFE_LINE.fullmatch(text_line):
+            return SAFE_FACE_OK
         try:
-            if suspicious_line(text_line, tk_font):
+            if contains_ascii_control_chars(text_line):
                 return SAFE_FACE_BAD
+            if text_line.isascii():
+                return SAFE_FACE_OK  # only CR/TAB-style controls, which are allowed
+            visible = tuple(dict.fromkeys(
+                g for g in graphemes(text_line) if not looks_like_ascii(g, None)
+            ))
         except Exception:
             return SAFE_FACE_MED
+        if not visible:
+            return SAFE_FACE_BAD
+        return (text_line, visible)
+
+    def _measured_face(self, text_line: str, visible: Tuple[str, ...]) -> str:
+        """UI-thread half of the face rules: 😐 if any candidate grapheme has width, else 😡."""
+        key = (text_line, self._face_font_key)
+        face = self._face_cache.get(key)
+        if face is None:
+            font = self._mono_font
+            face = SAFE_FACE_MED if any(apparent_width(g, font) for g in visible) else SAFE_FACE_BAD
+            cache = self._face_cache
+            if len(cache) >= FACE_CACHE_SIZE:
+                del cache[next(iter(cache))]  # oldest first
+            cache[key] = face
+        return face
+
+    def _toast(self, text: str, ms: int = 2500, fg: str = FG_OK):
+        """Non-modal, self-dismissing notice over the editor's status bar (fg=FG_WARN for failures)."""
+        self._toast_dismiss()
+        lbl = tk.Label(self.editor, text=text, bg=DARK_PANEL_2, fg=fg, padx=10, pady=4, anchor="w")
+        lbl.place(relx=0.0, rely=1.0, x=8, y=-32, anchor="sw")
+        self._toast_label = lbl
+
+        def _dismiss():
+            try:
+                lbl.destroy()
+            except Exception:
+                pass
+            if getattr(self, "_toast_label", None) is lbl:
+                self._toast_label = None
 
-        try:
-            if exists_outside_printable_ascii_plane(text_line):
-                return SAFE_FACE_MED
-        except Exception:
-            return SAFE_FACE_MED
+        self.after(ms, _dismiss)
 
-        return SAFE_FACE_OK
+    def _toast_dismiss(self):
+        """Remove the current toast (if any) early."""
+        old = getattr(self, "_toast_label", None)
+        if old is not None:
+            try:
+                old.destroy()
+            except Exception:
+                pass
+            self._toast_label = None
 
     # ========== Line Sanitize Dialog (selective) ==========
 
@@ -380,15 +659,7 @@ class TextPanel:
         if not tab:
             return
         txt: tk.Text = tab["text"]
-        index = txt.index(f"@0,{event.y}")
-        line_no = int(index.split(".")[0])
-        line_text = txt.get(f"{line_no}.0", f"{line_no}.end")
-
-        try:
-            tk_font = tkfont.Font(font=txt["font"])
-        except Exception:
-            tk_font = tkfont.nametofont("TkFixedFont")
-        face_char = self._line_face_for(line_text, tk_font)
+        line_no = self._text_line_count(txt, f"@0,{event.y}")
 
         # ↓↓↓ pass tid so the dialog can find the right Text widget/tab
         self._open_face_legend_dialog(tid, line_no)
@@ -585,18 +856,60 @@ class TextPanel:
 
     @staticmethod
     def _normalize_eols(s: str) -> str:
-        s = s.replace("\r\n", "\n")
-        s = s.replace("\r", "\n")
-        return s
+        # LF-only text (the common case) is returned untouched: one memchr-speed scan
+        if "\r" not in s:
+            return s
+        # CRLF → LF, then any lone CR → LF. Two memchr-driven replace() passes beat
+        # both str.translate (per-char mapping, very slow on non-ASCII text) and re.sub
+        return s.replace("\r\n", "\n").replace("\r", "\n")
+
+    @staticmethod
+    def _text_line_count(txt: tk.Text, upto: str = "end-1c") -> int:
+        """Line number of index `upto` (default: total lines) via one Tk `count -lines`."""
+        try:
+            n = txt.count("1.0", upto, "lines")
+        except tk.TclError:
+            return 1
+        return (int(n[0]) if n else 0) + 1
+
+    def _insert_bulk(self, txt: tk.Text, text: str):
+        """
+        Insert a whole document into an empty Text. Large documents go in as
+        fixed-size chunks with undo autoseparators off, so the undo stack gets
+        one entry and Tk never marshals one giant string. Every few chunks the
+        status bar shows progress and pending redraws are flushed.
+        """
+        n = len(text)
+        if n <= BULK_INSERT_THRESHOLD:
+            txt.insert("1.0", text)
+            return
+        txt.configure(autoseparators=False)
+        try:
+            txt.mark_set("insert", "1.0")
+            for k, i in enumerate(range(0, n, BULK_INSERT_CHUNK), start=1):
+                txt.insert("end-1c", text[i:i + BULK_INSERT_CHUNK])
+                if k % BULK_INSERT_YIELD_EVERY == 0:
+                    self._status_info.config(text=f"Loading… {i * 100 // n}%")
+                    self._status_last = (self._status_last[0], "")
+                    self.update_idletasks()
+        finally:
+            txt.configure(autoseparators=True)
+            txt.edit_separator()
+        txt.mark_set("insert", "1.0")
+
+    @staticmethod
+    def _iter_text_chunks(txt: tk.Text, lines_per_chunk: int = 8192):
+        """Yield a Text buffer's content ("1.0" .. "end-1c") in chunks of whole lines."""
+        total = TextPanel._text_line_count(txt)
+        for start in range(1, total + 1, lines_per_chunk):
+            stop = start + lines_per_chunk
+            yield txt.get(f"{start}.0", f"{stop}.0" if stop <= total else "end-1c")
 
     def _current_tab(self) -> Optional[Dict]:
         cur = self._nb.select()
-        if not cur or cur == str(self._plus_tab):
+        if not cur or cur == self._plus_tab_str:
             return None
-        for _tid, tab in self._tabs.items():
-            if str(tab["frame"]) == cur:
-                return tab
-        return None
+        return self._tabs_by_widget.get(cur)
 
     # =====================================================================
     # File menu: Open Selected / Save Over Selected
@@ -674,11 +987,32 @@ class TextPanel:
     # =========================
     def _mod_squelch_begin(self, tab: Dict):
         """Increment a counter that tells _on_modified to ignore spurious events."""
-        tab["squelch_mod"] = int(tab.get("squelch_mod", 0)) + 1
+        tab["squelch_mod"] += 1
 
     def _mod_squelch_end(self, tab: Dict):
         """Decrement squelch counter (never below zero)."""
-        tab["squelch_mod"] = max(0, int(tab.get("squelch_mod", 0)) - 1)
+        tab["squelch_mod"] = max(0, tab["squelch_mod"] - 1)
+
+    def _queue_squelch_settle(self, tab: Dict):
+        """Settle `tab` at the next idle; one shared after_idle serves every queued tab."""
+        self._settle_queue.append(tab)
+        if not self._settle_armed:
+            self._settle_armed = True
+            self.after_idle(self._drain_squelch_settles)
+
+    def _drain_squelch_settles(self):
+        self._settle_armed = False
+        queued, self._settle_queue = self._settle_queue, []
+        for tab in queued:
+            self._mod_squelch_settle(tab)
+
+    def _mod_squelch_settle(self, tab: Dict):
+        """after_idle tail of a programmatic edit: end the squelch and clear the modified flag."""
+        self._mod_squelch_end(tab)
+        try:
+            tab["text"].edit_modified(False)
+        except tk.TclError:
+            pass  # tab destroyed meanwhile
 
     # ==========================================
     # Build a tab's internals (single definition)
@@ -693,8 +1027,9 @@ class TextPanel:
         encoding: str = "utf-8",
         add_bom: bool = False,
     ) -> int:
-        # Font
-        mono = tkfont.Font(family="Monospace", size=11)
+        # Stable small-int tab id for the tab's lifetime
+        tid = self._next_tid
+        self._next_tid += 1
 
         # Container
         host = tk.Frame(frame, bg=DARK_PANEL, highlightthickness=0, bd=0)
@@ -705,14 +1040,13 @@ class TextPanel:
         host.grid_columnconfigure(3, weight=1)
 
         # Line numbers gutter (unselectable)
-        ln = tk.Canvas(host, width=48, bg="#101828", highlightthickness=0, bd=0, takefocus=0)
+        ln = tk.Canvas(host, width=self._ln_gutter_w, bg="#101828", highlightthickness=0, bd=0, takefocus=0)
         ln.grid(row=0, column=0, sticky="ns")
-        ln.bind("<Button-1>", lambda e: "break")
+        ln.bind("<Button-1>", self._swallow_evt)
 
         # Safety faces gutter (unselectable)
         face = tk.Canvas(host, width=18, bg="#0d1628", highlightthickness=0, bd=0, takefocus=0)
         face.grid(row=0, column=1, sticky="ns")
-        face.bind("<Button-1>", lambda e: "break")
 
         # Soft spacer
         sep = tk.Frame(host, width=1, bg=DARK_PANEL, highlightthickness=0, bd=0)
@@ -730,59 +1064,71 @@ class TextPanel:
             bd=0,
             padx=8,
             pady=6,
-            font=mono,
+            font=self._mono_font,
             highlightthickness=0,
         )
         txt.grid(row=0, column=3, sticky="nsew")
         scroll = ttk.Scrollbar(host, orient="vertical", command=txt.yview)
         scroll.grid(row=0, column=4, sticky="ns")
         txt.configure(
-            yscrollcommand=lambda first, last, tid=None: self._on_text_yscroll(id(frame), first, last)
+            yscrollcommand=functools.partial(self._on_text_yscroll, tid)
         )
 
         # Model
         tab = {
+            "tid": tid,
             "frame": frame,
-            "host": host,
             "ln": ln,
             "face": face,
             "text": txt,
             "scroll": scroll,
-            "path": path,
+            "path": None,      # set via _set_tab_path below
+            "path_key": None,  # resolved path; key into _tids_by_path
             "title": title,
             "encoding": encoding,
             "add_bom": add_bom,
             "dirty": False,
-            "last_paint": 0.0,
-            "repaint_due": None,
+            "edits": 0,        # user edits so far; lets background saves detect edits made meanwhile
+            "active": False,   # visible tab? (set by _on_tab_changed; gates gutter repaints)
+            "ln_item": None,   # the single multi-line line-number canvas item
+            "face_pool": [],   # reusable safety-face canvas items
+            "face_state": [],
+            "paint_key": None, # (first, last, y0, fh, visible text) of the last paint
+            "paint_ms": 0.0,   # wall time of the last gutter paint; sets the repaint delay
+            "paint_at": 0.0,   # monotonic time that paint finished (leading-edge repaints)
+            "disk_bytes": None,  # file bytes while the tab is clean; see _remember_disk_bytes
+            "disk_enc": None,    # (encoding, add_bom) those bytes are valid for
+            "yview_last": None,  # (first, last) fractions of the last yscrollcommand
             "squelch_mod": 0,  # guard for spurious <<Modified>> during programmatic edits
+            "scan_fut": None,  # in-flight face scan (see _draw_gutters)
         }
-        tid = id(frame)
         self._tabs[tid] = tab
+        self._tabs_by_widget[str(frame)] = tab
+        self._set_tab_path(tab, path)
 
         # Fill content under a squelch window so <<Modified>> won't mark dirty
         self._mod_squelch_begin(tab)
         try:
             if initial_text:
-                txt.insert("1.0", self._normalize_eols(initial_text))
+                self._insert_bulk(txt, self._normalize_eols(initial_text))
             txt.edit_reset()
             txt.edit_modified(False)
         finally:
             # End squelch after idle in case <<Modified>> is delivered late
-            self.after_idle(lambda t=tab: (self._mod_squelch_end(t), t["text"].edit_modified(False)))
+            self._queue_squelch_settle(tab)
 
-        # Bindings
-        txt.bind("<<Modified>>", lambda _e, t=tid: self._on_modified(t), add="+")
-        txt.bind("<KeyRelease>", lambda _e, t=tid: self._on_text_activity(t), add="+")
-        txt.bind("<ButtonRelease-1>", lambda _e, t=tid: self._on_text_activity(t), add="+")
-        txt.bind("<Configure>", lambda _e, t=tid: self._schedule_draw_gutters(t), add="+")
-        txt.bind("<MouseWheel>", lambda _e, t=tid: self._schedule_draw_gutters(t), add="+")
-        txt.bind("<Button-4>", lambda _e, t=tid: self._schedule_draw_gutters(t), add="+")
-        txt.bind("<Button-5>", lambda _e, t=tid: self._schedule_draw_gutters(t), add="+")
-        txt.bind("<Control-a>", lambda e, t=tid: (txt.tag_add("sel", "1.0", "end-1c"), "break"))
+        # Bindings (functools.partial: C-level callables, no per-tab closures)
+        on_activity = functools.partial(self._on_text_activity_evt, tid)
+        txt.bind("<<Modified>>", functools.partial(self._on_modified_evt, tid), add="+")
+        txt.bind("<KeyRelease>", on_activity, add="+")
+        txt.bind("<ButtonRelease-1>", on_activity, add="+")
+        # Wheel/scrollbar scrolling already reaches _on_text_yscroll via yscrollcommand,
+        # so only geometry changes need their own repaint request.
+        txt.bind("<Configure>", functools.partial(self._schedule_draw_gutters_evt, tid), add="+")
+        txt.bind("<Control-a>", functools.partial(self._select_all_evt, tid))
 
-        # Click faces to open a simple legend
-        face.bind("<Button-1>", lambda e, t=tid: self._on_face_click(t, e))
+        # Click faces to open a simple legend (one widget-level binding; pooled items need none)
+        face.bind("<Button-1>", functools.partial(self._on_face_click, tid))
 
         # Title & first paint
         self._retitle_tab(tid, title, dirty=False)
@@ -794,6 +1140,31 @@ class TextPanel:
     # ==================================================
     # Rename hook from FilePanel (replacement, squelched)
     # ==================================================
+    @staticmethod
+    def _path_key(path: Optional[Path]) -> Optional[Path]:
+        if path is None:
+            return None
+        try:
+            return Path(path).resolve()
+        except Exception:
+            return Path(path)
+
+    def _set_tab_path(self, tab: Dict, path: Optional[Path]):
+        """Point a tab at `path`, keeping the resolved-path → tids index in step."""
+        self._unindex_tab_path(tab)
+        tab["path"] = path
+        key = tab["path_key"] = self._path_key(path)
+        if key is not None:
+            self._tids_by_path.setdefault(key, set()).add(tab["tid"])
+
+    def _unindex_tab_path(self, tab: Dict):
+        key = tab["path_key"]
+        tids = self._tids_by_path.get(key)
+        if tids is not None:
+            tids.discard(tab["tid"])
+            if not tids:
+                del self._tids_by_path[key]
+
     def on_path_renamed(self, old_path: Path, new_path: Path):
         """Update any open tab's path/title WITHOUT marking it dirty."""
         try:
@@ -802,23 +1173,16 @@ class TextPanel:
         except Exception:
             return
 
-        for tid, tab in list(self._tabs.items()):
-            p = tab.get("path")
-            if not p:
-                continue
-            try:
-                if Path(p).resolve() != old_r:
-                    continue
-            except Exception:
-                continue
-
+        # One dict lookup: keys were resolved once when each tab's path was set
+        for tid in list(self._tids_by_path.get(old_r, ())):
+            tab = self._tabs[tid]
             was_dirty = bool(tab.get("dirty"))
             txt: tk.Text = tab["text"]
 
             # Squelch any spurious <<Modified>> around title/path churn.
             self._mod_squelch_begin(tab)
             try:
-                tab["path"] = new_r
+                self._set_tab_path(tab, new_r)
                 self._retitle_tab(tid, new_r.name, dirty=was_dirty)
                 self._update_status_for_tab(tab)
                 try:
@@ -827,7 +1191,7 @@ class TextPanel:
                     pass
             finally:
                 # End after idle – some Tk builds deliver <<Modified>> late.
-                self.after_idle(lambda t=tab: (self._mod_squelch_end(t), t["text"].edit_modified(False)))
+                self._queue_squelch_settle(tab)
 
     # =====================================================================
     # Save Over Selected (File menu) — overwrite selected file *content only*
@@ -843,32 +1207,47 @@ class TextPanel:
             messagebox.showinfo("Save Over Selected", "Please select a file in the File Manager.")
             return
 
-        # prepare content & encoding
+        # pick encoding (one dialog; wide enough)
         default_enc = tab.get("encoding") or "utf-8"
-        content = tab["text"].get("1.0", "end-1c")
-        data, final_enc = encode_text_inline(self, content, default_enc)  # one dialog; wide enough
+        final_enc = choose_encoding_inline(self, default_enc)
+        if not final_enc:
+            return
 
-        # Write-in-place (preserve metadata other than size/mtime)
-        with open(target, "r+b") as f:
-            f.truncate(0)
-            f.write(data)
-            f.flush()
+        # Snapshot the buffer (Tk must be read on this thread) as line chunks, then
+        # encode + write on the I/O worker so a big/slow write never freezes the UI.
+        # save_over_file keeps the selected file's identity (symlinks, hardlinks,
+        # owner, xattrs) and only swaps in a temp file when that is invisible.
+        chunks = list(self._iter_text_chunks(tab["text"]))
+        fut = self._io_pool.submit(save_over_file, target, iter_encoded_chunks(chunks, final_enc))
+        self._io_when_done(fut, self._finish_save_over, tab["tid"], target, final_enc, tab["edits"])
+
+    def _finish_save_over(self, tid: int, target: Path, final_enc: str, edits_at_snapshot: int, fut):
+        """UI-thread half of save_over_selected: adopt the file, clean unless edited meanwhile."""
+        try:
+            fut.result()
+        except Exception as e:
+            messagebox.showerror("Save Over Selected", f"Could not save over {target}:\n{e}")
+            return
+        tab = self._tabs.get(tid)
+        if not tab:
+            return
 
         # The tab should now point at the overwritten file (and be clean)
-        tab["path"] = target
+        self._set_tab_path(tab, target)
         tab["encoding"] = final_enc
         tab["add_bom"] = (final_enc.lower() == "utf-8-with-bom")
-        tab["dirty"] = False
-
-        try:
-            tab["text"].edit_modified(False)
-            tab["text"].edit_reset()
-        except Exception:
-            pass
+        self._remember_disk_bytes(tab, None)
+        if tab["edits"] == edits_at_snapshot:
+            tab["dirty"] = False
+            try:
+                tab["text"].edit_modified(False)
+                tab["text"].edit_reset()
+            except Exception:
+                pass
 
-        self._retitle_tab(id(tab["frame"]), target.name, dirty=False)
+        self._retitle_tab(tid, target.name, dirty=tab["dirty"])
         self._update_status_for_tab(tab)
-        messagebox.showinfo("Save Over Selected", f"Saved over:\n{target}")
+        self._toast(f"Saved over: {target}")
 
     # =====================================================================
     # Modified/Dirty tracking — ensure both tab label *and* status get the star
@@ -881,32 +1260,45 @@ class TextPanel:
             line, col = int(line_s), int(col_s) + 1
         except Exception:
             line, col = 1, 1
+        total = self._text_line_count(txt)
         enc = tab.get("encoding") or "utf-8"
         dirty_star = "*" if tab.get("dirty") else ""
         path_str = str(tab["path"]) if tab.get("path") else "(untitled)"
-        self._status_path_var.set(f"{path_str}{dirty_star}")
-        self._status_info.config(text=f"Ln {line}, Col {col}  | {enc}")
+        status = (f"{path_str}{dirty_star}", f"Ln {line}, Col {col}  | {total} lines  | {enc}")
+        # Most keystrokes change only the column: touch only the label that differs
+        last = self._status_last
+        if status[0] != last[0]:
+            self._status_path_var.set(status[0])
+        if status[1] != last[1]:
+            self._status_info.config(text=status[1])
+        self._status_last = status
 
     def _on_modified(self, tid: int):
         tab = self._tabs.get(tid)
         if not tab:
             return
-        if int(tab.get("squelch_mod", 0)) > 0:
+        if tab["squelch_mod"] > 0:
             try:
                 tab["text"].edit_modified(False)
             except Exception:
                 pass
             return
 
+        was_dirty = tab["dirty"]
         tab["dirty"] = True
+        tab["edits"] += 1
         try:
             tab["text"].edit_modified(False)
         except Exception:
             pass
 
-        base_title = tab.get("title") or (tab.get("path").name if tab.get("path") else "Untitled")
-        self._retitle_tab(tid, base_title, dirty=True)
-        self._update_status_for_tab(tab)
+        # The title/status star only flips on the clean → dirty transition; later
+        # edits refresh the status from the debounced repaint drain
+        if not was_dirty:
+            self._remember_disk_bytes(tab, None)
+            base_title = tab.get("title") or (tab.get("path").name if tab.get("path") else "Untitled")
+            self._retitle_tab(tid, base_title, dirty=True)
+            self._update_status_for_tab(tab)
         self._schedule_draw_gutters(tid, fast=False)
 
     # =====================================================================
@@ -920,10 +1312,16 @@ class TextPanel:
         if not messagebox.askyesno("Revert", f"Discard changes and reload from disk?\n\n{p}"):
             return
 
+        fut = self._io_pool.submit(self._load_text_file, Path(p), tab.get("encoding") or "utf-8")
+        self._io_when_done(fut, self._finish_revert, tab["tid"], p)
+
+    def _finish_revert(self, tid: int, p: Path, fut):
+        """UI-thread half of _revert_from_disk: swap in the reloaded text."""
+        tab = self._tabs.get(tid)
+        if not tab:
+            return  # tab closed while reading
         try:
-            data = read_text_bytes(p)
-            text = decode_bytes(data, tab.get("encoding") or "utf-8", "strict")
-            text = self._normalize_eols(text)
+            text, _enc, raw = fut.result()
         except Exception as e:
             messagebox.showerror("Revert failed", f"Could not reload {p}:\n{e}")
             return
@@ -933,76 +1331,162 @@ class TextPanel:
         self._mod_squelch_begin(tab)
         try:
             txt.delete("1.0", "end")
-            txt.insert("1.0", text)
+            self._insert_bulk(txt, text)
             tab["dirty"] = False
+            self._remember_disk_bytes(tab, raw)
             try:
                 txt.edit_modified(False)
                 txt.edit_reset()
             except Exception:
                 pass
         finally:
-            self.after_idle(lambda t=tab: (self._mod_squelch_end(t), t["text"].edit_modified(False)))
+            self._queue_squelch_settle(tab)
 
         title = (tab["path"].name if tab.get("path") else tab.get("title") or "Untitled")
-        self._retitle_tab(id(tab["frame"]), title, dirty=False)
+        self._retitle_tab(tab["tid"], title, dirty=False)
         self._update_status_for_tab(tab)
-        self._schedule_draw_gutters(id(tab["frame"]), fast=True)
+        self._schedule_draw_gutters(tab["tid"], fast=True)
 
     def _save_tab_to_path(self, tab: Dict, target: Path):
         """Save the current tab to path `target`; preserve clean state after save."""
-        s = tab["text"].get("1.0", "end-1c")
+        txt: tk.Text = tab["text"]
         try:
             enc = tab.get("encoding") or "utf-8"
             add_bom = bool(tab.get("add_bom"))
-            data = encode_text(s, enc, add_bom)
-            save_to_path(target, data)
+            if not tab["dirty"] and tab["disk_enc"] == (enc, add_bom):
+                # Unedited since open/revert, same encoding → the loaded bytes are the file
+                save_to_path(target, tab["disk_bytes"])
+            else:
+                n_chars = int((txt.count("1.0", "end-1c", "chars") or (0,))[0])
+                if n_chars <= STREAM_SAVE_THRESHOLD:
+                    save_to_path(target, encode_text(txt.get("1.0", "end-1c"), enc, add_bom))
+                else:
+                    # Large buffer: stream line chunks through an incremental encoder
+                    save_chunks_to_path(target, iter_encoded_chunks(self._iter_text_chunks(txt), enc, add_bom))
+                self._remember_disk_bytes(tab, None)
         except Exception as e:
             messagebox.showerror("Save failed", f"Could not save to {target}:\n{e}")
             return
 
-        txt: tk.Text = tab["text"]
         self._mod_squelch_begin(tab)
         try:
-            tab["path"] = Path(target)
+            self._set_tab_path(tab, Path(target))
             tab["dirty"] = False
-            self._retitle_tab(id(tab["frame"]), tab["path"].name, dirty=False)
+            self._retitle_tab(tab["tid"], tab["path"].name, dirty=False)
             try:
                 txt.edit_modified(False)
                 txt.edit_reset()
             except Exception:
                 pass
         finally:
-            self.after_idle(lambda t=tab: (self._mod_squelch_end(t), t["text"].edit_modified(False)))
+            self._queue_squelch_settle(tab)
 
         self._update_status_for_tab(tab)
-        self._schedule_draw_gutters(id(tab["frame"]), fast=True)
+        self._schedule_draw_gutters(tab["tid"], fast=True)
 
     def open_with_zeropad(self, path: Path, override_encoding: str | None = None):
-        """Open file; normalize EOLs to LF. If override_encoding is provided, use it."""
-        try:
-            enc = override_encoding or suggest_open_encoding(path)
-            data = read_text_bytes(path)
+        """
+        Open file; normalize EOLs to LF. If override_encoding is provided, use it.
+        Reading/decoding runs on the I/O worker; the tab appears once it finishes.
+        """
+        path = Path(path)
+        self._toast(f"Opening {path.name}…", ms=60000)
+        self._opens_in_flight += 1
+        fut = self._io_pool.submit(self._load_text_file, path, override_encoding)
+        self._io_when_done(fut, self._queue_finished_open, path)
+
+    @staticmethod
+    def _load_text_file(path: Path, encoding: Optional[str]) -> Tuple[str, str, Optional[bytes]]:
+        """
+        Worker side of open/revert: read, decode and EOL-normalize.
+        Returns (text, encoding, raw). raw is the file's bytes only when they are
+        known to be what a clean save (encode_text with the label's BOM) writes:
+        an _EOL_BYTES_SAFE encoding, no CR/CRLF rewritten, and for
+        'utf-8-with-bom' a BOM actually present. Otherwise raw is None.
+        """
+        enc = encoding or suggest_open_encoding(path)
+        mm = map_text_file(path)
+        if mm is not None:
+            # Large file: decode straight from the mapping. The mapping is never
+            # kept, so such tabs get no raw-bytes save path.
+            with mm:
+                if enc.lower() not in _EOL_BYTES_SAFE:
+                    return TextPanel._normalize_eols(decode_bytes(mm, enc, "strict")), enc, None
+                if mm.find(b"\r") == -1:
+                    return decode_bytes(mm, enc, "strict"), enc, None
+            # CRs to translate → needs an owned copy; fall through
+
+        data = read_text_bytes(path)
+        if enc.lower() in _EOL_BYTES_SAFE:
+            # CRLF and lone (classic Mac) CR → LF on the bytes, before the decode
+            if b"\r" in data:
+                data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+                return decode_bytes(data, enc, "strict"), enc, None
             text = decode_bytes(data, enc, "strict")
-        except Exception as e:
-            messagebox.showerror("Open failed", f"Could not open {path}:\n{e}")
-            return
+            if enc.lower() == "utf-8-with-bom" and not data.startswith(b"\xef\xbb\xbf"):
+                return text, enc, None  # a save would add the BOM
+            return text, enc, data
+        # Other codecs (UTF-16, ...) aren't known to round-trip byte-for-byte
+        return TextPanel._normalize_eols(decode_bytes(data, enc, "strict")), enc, None
 
-        text = self._normalize_eols(text)
-        frame = tk.Frame(self._nb, bg=DARK_PANEL)
-        tid = self._mk_tab_ui(
-            frame,
-            title=Path(path).name,
-            path=Path(path),
-            initial_text=text,
-            encoding=enc,
-            add_bom=(enc.lower() == "utf-8-with-bom"),
-        )
-        self._add_tab_to_nb(frame, title=Path(path).name)
-        self._nb.select(frame)
+    @staticmethod
+    def _remember_disk_bytes(tab: Dict, raw: Optional[bytes]):
+        """Keep the on-disk bytes of a clean tab for the zero-encode save path."""
+        tab["disk_bytes"] = raw
+        tab["disk_enc"] = (tab["encoding"], bool(tab["add_bom"])) if raw is not None else None
+
+    def _io_when_done(self, fut, callback, *args):
+        """Call callback(*args, fut) on the Tk thread once an I/O-pool job finishes."""
+        def _done(f):
+            try:
+                self.after(0, callback, *args, f)
+            except (RuntimeError, tk.TclError):
+                pass  # app is shutting down
+        fut.add_done_callback(_done)
+
+    def _queue_finished_open(self, path: Path, fut):
+        """Collect finished loads; one idle pass turns every ready file into a tab."""
+        self._opens_in_flight -= 1
+        self._pending_opens.append((path, fut))
+        if not self._pending_opens_armed:
+            self._pending_opens_armed = True
+            self.after_idle(self._drain_pending_opens)
+
+    def _drain_pending_opens(self):
+        """
+        UI-thread half of open_with_zeropad: build tabs for all loads that finished
+        since the last pass (e.g. a multi-file drop), selecting only the last one.
+        """
+        self._pending_opens_armed = False
+        ready, self._pending_opens = self._pending_opens, []
+        if not self._opens_in_flight:
+            self._toast_dismiss()
 
-        self._force_clean_state(tid)
-        self._schedule_draw_gutters(tid, fast=True)
-        return tid
+        last_frame = last_tid = None
+        for path, fut in ready:
+            try:
+                text, enc, raw = fut.result()
+            except Exception as e:
+                messagebox.showerror("Open failed", f"Could not open {path}:\n{e}")
+                continue
+
+            frame = tk.Frame(self._nb, bg=DARK_PANEL)
+            tid = self._mk_tab_ui(
+                frame,
+                title=path.name,
+                path=path,
+                initial_text=text,
+                encoding=enc,
+                add_bom=(enc.lower() == "utf-8-with-bom"),
+            )
+            self._remember_disk_bytes(self._tabs[tid], raw)
+            self._add_tab_to_nb(frame, title=path.name)
+            self._force_clean_state(tid)
+            last_frame, last_tid = frame, tid
+
+        if last_frame is not None:
+            self._nb.select(last_frame)
+            self._schedule_draw_gutters(last_tid, fast=True)
 
     # =====================================================================
     # Notebook tab interactions (close/new)
@@ -1013,18 +1497,31 @@ class TextPanel:
         Install a highest-priority click handler for the notebook tabs.
         We intercept on press so we can consume the event before ttk selects the tab.
         """
-        self._NB_CLOSE_TAG = "ZP_NB_CLOSE"
+        # One-shot: the bindtags are already in place after the first run
+        if getattr(self, "_nb_tag_installed", False):
+            return
+        # Per-instance tag: a shared class tag would run every panel's handler
+        # (stacked by add="+") on every notebook press
+        self._NB_CLOSE_TAG = f"ZP_NB_CLOSE_{id(self):x}"
         # Put our tag first so we run before widget/class/default bindings
-        tags = list(self._nb.bindtags())
-        if self._NB_CLOSE_TAG in tags:
-            tags.remove(self._NB_CLOSE_TAG)
-        tags.insert(0, self._NB_CLOSE_TAG)
-        self._nb.bindtags(tuple(tags))
+        tag = self._NB_CLOSE_TAG
+        self._nb.bindtags((tag,) + tuple(t for t in self._nb.bindtags() if t != tag))
+        self._nb_tag_installed = True
 
         # Bind on press
-        self.bind_class(self._NB_CLOSE_TAG, "<Button-1>", self._nb_click_intercept, add="+")
+        self.bind_class(self._NB_CLOSE_TAG, "<Button-1>", self._nb_click_intercept)
+
+        # '+' tab parcel cache for the intercept's hit-test
+        self._plus_bbox = None
+        self._plus_click_ns = 0
+        self._nb.bind("<Configure>", self._invalidate_plus_bbox, add="+")
+
+    def _invalidate_plus_bbox(self, _evt=None):
+        """Tab strip geometry may have changed (add/close/retitle/resize): refetch on next press."""
+        self._plus_bbox = None
 
     def _add_tab_to_nb(self, frame: tk.Frame, title: str):
+        self._invalidate_plus_bbox()
         label = f"{title}"  # no cross
         try:
             self._nb.insert(1, frame, text=label)  # after '+'
@@ -1039,6 +1536,7 @@ class TextPanel:
             return
         tab["title"] = title
         frame = tab["frame"]
+        self._invalidate_plus_bbox()  # labels resize tabs (and squeeze the strip when full)
         try:
             self._nb.tab(frame, text=label)
         except Exception:
@@ -1047,50 +1545,100 @@ class TextPanel:
     # _nb_click_intercept
     def _nb_click_intercept(self, event):
         nb = self._nb
-        if not nb.winfo_ismapped():
-            return
+        # The tag is bound on the notebook only, so the press is delivered to it:
+        # it is mapped, and event.x/y are already notebook-relative (no winfo_* calls)
+        nx, ny = event.x, event.y
+
+        # Only the '+' tab (always index 0) is handled here; every other press is
+        # left to ttk. Hit-test its cached parcel in Python (refetched lazily after
+        # any tab-strip geometry change; see _invalidate_plus_bbox).
+        box = self._plus_bbox
+        if box is None:
+            try:
+                box = tuple(nb.bbox(0))
+            except Exception:
+                return
+            if len(box) != 4:
+                return  # not laid out yet
+            bx, by, bw, bh = box
+            box = self._plus_bbox = (bx, by, bx + bw, by + bh)  # edges, not extents
+        x0, y0, x1, y1 = box
+        if not (x0 <= nx < x1 and y0 <= ny < y1):
+            return  # a normal tab (or empty strip): let ttk handle selection
 
-        try:
-            nx = event.x_root - nb.winfo_rootx()
-            ny = event.y_root - nb.winfo_rooty()
-        except Exception:
-            return
+        # '+' tab behavior
+        # Coalesce bursts (pen/tablet bounce, duplicate presses): one new tab per press
+        now = time.monotonic_ns()
+        if now - self._plus_click_ns < PLUS_CLICK_DEBOUNCE_NS:
+            return "break"
+        self._plus_click_ns = now
 
-        try:
-            idx = nb.index(f"@{nx},{ny}")
-        except Exception:
-            return  # not over a tab
+        # modifier keys
+        state = getattr(event, "state", 0)
+        if state & 0x0005:  # ShiftMask | ControlMask
+            # focus first real tab (index 1), do nothing else; the model already
+            # knows whether one exists, so no nb.tabs() round-trip
+            if self._tabs:
+                try:
+                    nb.select(1)
+                except Exception:
+                    pass
+            return "break"
+
+        # normal '+' click → create new tab
+        self._create_empty_tab_and_select()
+        return "break"  # don't let ttk select '+'
+
+    @staticmethod
+    def _sanitize_legend_line(line: str, mode: str) -> str:
+        """Worker side of the legend dialog: 'strip' or 'skeleton_strip' one line."""
+        if mode != "strip":
+            try:
+                line = confusable_skeleton(line)
+            except Exception:
+                pass
+        # Keep only ASCII printable chars 0x20 (space) to 0x7E (~)
+        return "".join(ch for ch in line if 0x20 <= ord(ch) <= 0x7E)
 
+    def _apply_legend_line(self, tid: int, line_no: int, original_line: str,
+                           insert_col: Optional[int], yview0: float, fut):
+        """UI-thread half of the legend dialog: swap in the sanitized line."""
+        tab = self._tabs.get(tid)
+        if not tab:
+            return
         try:
-            bx, by, bw, bh = nb.bbox(idx)
-        except Exception:
+            new_line = fut.result()
+        except Exception as e:
+            self._toast(f"Line {line_no} was not sanitized: {e}", fg=FG_WARN)
             return
-
-        if not (bx <= nx <= bx + bw and by <= ny <= by + bh):
+        textw: tk.Text = tab["text"]
+        line_start, line_end = f"{line_no}.0", f"{line_no}.end"
+        # The user may have kept typing while the worker ran; never clobber an edited line
+        if textw.get(line_start, line_end) != original_line:
+            self._toast(f"Line {line_no} changed while sanitizing; left as is. Try again.", fg=FG_WARN)
             return
 
-        # modifier keys
-        state = getattr(event, "state", 0)
-        shift_held   = bool(state & 0x0001)  # ShiftMask
-        ctrl_held    = bool(state & 0x0004)  # ControlMask
+        # Replace the line (single undo step)
+        textw.edit_separator()
+        textw.delete(line_start, line_end)
+        textw.insert(line_start, new_line)
 
-        # '+' tab behavior
-        if idx == 0:
-            tabs = nb.tabs()
-            if shift_held or ctrl_held:
-                # focus first real tab (index 1), do nothing else
-                if len(tabs) > 1:
-                    try:
-                        nb.select(tabs[1])
-                    except Exception:
-                        pass
-                return "break"
-            else:
-                # normal '+' click → create new tab
-                self._create_empty_tab_and_select()
-                return "break"  # don't let ttk select '+'
+        # Preserve caret on that line if it was there
+        if insert_col is not None:
+            new_col = min(insert_col, len(new_line))
+            try:
+                textw.mark_set("insert", f"{line_no}.{new_col}")
+            except Exception:
+                pass
 
-        # For normal tabs, just let ttk handle selection.
+        # Restore scroll
+        try:
+            textw.yview_moveto(yview0)
+        except Exception:
+            pass
+
+        # Repaint gutters promptly
+        self._schedule_draw_gutters(tid, fast=True)
 
     def _open_face_legend_dialog(self, tid: int, line_no: int):
         """
@@ -1101,33 +1649,12 @@ class TextPanel:
         On OK: replace that line in the tab's Text widget. On Cancel: no changes.
         Includes dark-theme hover styles for radio/buttons. Cancel is on the right.
         """
-        import tkinter as tk
-        from tkinter import ttk
-
         # ---- resolve tab + text widget ----
         tab = self._tabs.get(tid)
         if not tab:
             return
         textw: tk.Text = tab["text"]
 
-        # ---- helpers ----
-        def ascii_printable_strip(s: str) -> str:
-            # Keep only ASCII printable chars 0x20 (space) to 0x7E (~)
-            return "".join(ch for ch in s if 0x20 <= ord(ch) <= 0x7E)
-
-        # Try the likely module first, then the alternative the project mentioned.
-        try:
-            # If your function lives here:
-            from basic_string_safety_utils import confusable_skeleton
-        except Exception:
-            try:
-                # Or here, if your project uses this name:
-                from basis_string_safety import confusable_skeleton
-            except Exception:
-                # Fallback: no-op skeleton
-                def confusable_skeleton(text: str, mapping=None) -> str:
-                    return text
-
         # ---- parent toplevel (for proper modality) ----
         try:
             parent = self.winfo_toplevel()
@@ -1150,15 +1677,17 @@ class TextPanel:
         except Exception:
             original_line = ""
 
-        # ---- dialog (hidden → mapped → grabbed) ----
-        win = tk.Toplevel(parent)
-        self._legend_win = win
+        # ---- re-entrancy guard: one legend at a time; re-raise the open one ----
         if getattr(self, "_legend_open", False):
             try:
                 self._legend_win.lift(); self._legend_win.focus_set()
             except Exception:
                 pass
             return
+
+        # ---- dialog (hidden → mapped → grabbed) ----
+        win = tk.Toplevel(parent)
+        self._legend_win = win
         self._legend_open = True
 
         # Dark panel styling
@@ -1237,49 +1766,17 @@ class TextPanel:
                 win.grab_release()
             except Exception:
                 pass
-            self._legend_open = False
-            try:
+            # Non-blocking dialog: a late close from an older window must not
+            # clear the state a newer one owns
+            if getattr(self, "_legend_win", None) is win:
+                self._legend_open = False
                 del self._legend_win
-            except Exception:
-                pass
             win.destroy()
 
         def apply_and_close():
-            chosen = mode.get()
-            if chosen == "strip":
-                new_line = ascii_printable_strip(original_line)
-            else:
-                try:
-                    new_line = confusable_skeleton(original_line)
-                except Exception:
-                    new_line = original_line
-                new_line = ascii_printable_strip(new_line)
-
-            # Replace the line (single undo step)
-            textw.edit_separator()
-            textw.delete(line_start, line_end)
-            textw.insert(line_start, new_line)
-
-            # Preserve caret on that line if it was there
-            if insert_col is not None:
-                new_col = min(insert_col, len(new_line))
-                try:
-                    textw.mark_set("insert", f"{int(line_no)}.{new_col}")
-                except Exception:
-                    pass
-
-            # Restore scroll
-            try:
-                textw.yview_moveto(yview[0])
-            except Exception:
-                pass
-
-            # Repaint gutters promptly
-            try:
-                self._schedule_draw_gutters(tid, fast=True)
-            except Exception:
-                pass
-
+            # Sanitizing a pathological line can be slow → run it on the I/O worker
+            fut = self._io_pool.submit(self._sanitize_legend_line, original_line, mode.get())
+            self._io_when_done(fut, self._apply_legend_line, tid, int(line_no), original_line, insert_col, yview[0])
             close_modal()
 
         ok_btn     = ttk.Button(btns, text="OK",     command=apply_and_close, style="Dark.TButton")
@@ -1291,6 +1788,7 @@ class TextPanel:
         # shortcuts
         win.bind("<Return>", lambda e: apply_and_close())
         win.bind("<Escape>", close_modal)
+        win.protocol("WM_DELETE_WINDOW", close_modal)
 
         # center near parent
         win.update_idletasks()
@@ -1305,7 +1803,9 @@ class TextPanel:
         except Exception:
             pass
 
-        # show safely after mapping (prevents "not viewable" grab error)
+        # show safely after mapping (prevents "not viewable" grab error).
+        # No wait_window(): the dialog is event-driven, so the UI thread never sits in
+        # a nested loop while queued gutter repaints pile up; close_modal() cleans up.
         def _show_modal():
             try:
                 win.deiconify()
@@ -1319,13 +1819,7 @@ class TextPanel:
                 except tk.TclError:
                     pass
                 win.focus_set()
-                win.wait_window()
-            finally:
-                if getattr(self, "_legend_open", False):
-                    self._legend_open = False
-                try:
-                    del self._legend_win
-                except Exception:
-                    pass
+            except tk.TclError:
+                close_modal()
 
         win.after(0, _show_modal)